@@ -3,6 +3,7 @@ try:
 except ImportError:
     from django.utils.functional import classproperty
 from django.db.models.fields.related import ManyToOneRel
+from django.db.models.query import QuerySet
 
 from rest_framework.fields import (
     DictField, ListField, SkipField, Field, empty
@@ -54,6 +55,8 @@ def BaseNestedFieldSerializerFactory(
         accept_pk=False,
         accept_pk_only=False,
         allow_remove_all=False,
+        bulk_create=False,
+        bulk_update=False,
         create_ops=CREATE_OPERATIONS,
         update_ops=UPDATE_OPERATIONS,
         serializer_class=None,
@@ -80,6 +83,24 @@ def BaseNestedFieldSerializerFactory(
         "nested fields, ensure the kwarg `many=True` is set."
     )
 
+    assert not (
+        bulk_create and not many
+    ), (
+        "`bulk_create=True` can only be applied to many related "
+        "nested fields, ensure the kwarg `many=True` is set."
+    )
+
+    assert not (
+        bulk_update and not many
+    ), (
+        "`bulk_update=True` can only be applied to many related "
+        "nested fields, ensure the kwarg `many=True` is set."
+    )
+
+    assert not (
+        bulk_update and not hasattr(QuerySet, "bulk_update")
+    ), "`bulk_update=True` requires Django 2.2 or later."
+
     def join_words(words, many='are', single='is'):
         word_list = ["`" + word + "`" for word in words]
 
@@ -110,6 +131,14 @@ def BaseNestedFieldSerializerFactory(
         return None
 
     class BaseNestedField(BaseRESTQLNestedField):
+        # Whether objects created on this field are inserted
+        # with a single `bulk_create` query or saved one by one
+        use_bulk_create = bulk_create
+
+        # Whether objects updated on this field are written
+        # with a single `bulk_update` query or saved one by one
+        use_bulk_update = bulk_update
+
         @classproperty
         def serializer_class(cls):
             # Return original nested serializer
@@ -1,7 +1,9 @@
-from django.http import QueryDict
+from copy import deepcopy
+from functools import lru_cache
+
+from django.db import connections, router
 from django.db.models import Prefetch
 from django.utils.functional import cached_property
-from django.core.exceptions import ObjectDoesNotExist
 from django.db.models.fields.related import ManyToManyRel, ManyToOneRel
 
 try:
@@ -11,7 +13,14 @@ except ImportError:
     GenericRel = None
     ContentType = None
 
-from rest_framework.serializers import ListSerializer, Serializer, ValidationError
+from rest_framework.serializers import (
+    BaseSerializer,
+    ListSerializer,
+    ManyRelatedField,
+    ModelSerializer,
+    Serializer,
+    ValidationError,
+)
 
 from .exceptions import FieldNotFound, QueryFormatError
 from .fields import (
@@ -24,6 +33,17 @@ from .operations import ADD, CREATE, REMOVE, UPDATE
 from .parser import Query, QueryParser
 from .settings import restql_settings
 
+NESTED_FIELD_CLASSES = (Serializer, ListSerializer, DynamicSerializerMethodField)
+
+
+@lru_cache(maxsize=1024)
+def parse_restql_query(raw_query):
+    # A parsed query depends on nothing but the raw query and clients
+    # tend to send the same queries over and over, so parsed queries
+    # are shared between requests
+    parser = QueryParser()
+    return parser.parse(raw_query)
+
 
 class RequestQueryParserMixin(object):
     """
@@ -41,14 +61,20 @@ class RequestQueryParserMixin(object):
         query_param_name = restql_settings.QUERY_PARAM_NAME
         return query_param_name in request.GET
 
+    @staticmethod
+    def parse_restql_query(raw_query):
+        # Hand out a copy of a cached parsed query so that changes made
+        # on it(e.g by DynamicSerializerMethodField methods or on
+        # `request.parsed_restql_query`) don't leak to other requests
+        return deepcopy(parse_restql_query(raw_query))
+
     @classmethod
     def get_parsed_restql_query_from_req(cls, request):
         if hasattr(request, "parsed_restql_query"):
             # Use cached parsed restql query
             return request.parsed_restql_query
         raw_query = request.GET[restql_settings.QUERY_PARAM_NAME]
-        parser = QueryParser()
-        parsed_restql_query = parser.parse(raw_query)
+        parsed_restql_query = cls.parse_restql_query(raw_query)
 
         # Save parsed restql query to the request so that
         # we won't need to parse it again if needed later
@@ -86,8 +112,7 @@ class QueryArgumentsMixin(RequestQueryParserMixin):
         else:
             prefix = parent + "__"
             for argument, value in parsed_query.arguments.items():
-                name = prefix + argument
-                query_params.update({name: value})
+                query_params[prefix + argument] = value
 
         for field in parsed_query.included_fields:
             if isinstance(field, Query):
@@ -102,15 +127,22 @@ class QueryArgumentsMixin(RequestQueryParserMixin):
 
         # Generate query params from query arguments
         query_params = self.build_query_params(parsed)
+        if not query_params:
+            # There are no query arguments so request.GET stays as it is
+            return
 
         # We are using `request.GET` instead of `request.query_params`
         # because at this point DRF request is not yet created so
         # `request.query_params` is not yet available
         params = request.GET.copy()
-        params.update(query_params)
+        for name, value in query_params.items():
+            # Values are added as strings just like
+            # they would be if they came from a url
+            params.appendlist(name, str(value))
 
         # Make QueryDict immutable after updating
-        request.GET = QueryDict(params.urlencode(), mutable=False)
+        params._mutable = False
+        request.GET = params
 
     def dispatch(self, request, *args, **kwargs):
         self.inject_query_params_in_req(request)
@@ -158,29 +190,37 @@ class DynamicFieldsMixin(RequestQueryParserMixin):
     @cached_property
     def allowed_fields(self):
         fields = super().fields
+        if (
+            self.dynamic_fields_mixin_kwargs["fields"] is None
+            and self.dynamic_fields_mixin_kwargs["exclude"] is None
+        ):
+            # Neither `fields` nor `exclude` kwarg is used so all fields are allowed
+            return fields
+
+        existing = frozenset(fields)
+
         if self.dynamic_fields_mixin_kwargs["fields"] is not None:
             # Drop all fields which are not specified on the `fields` kwarg.
             allowed = set(self.dynamic_fields_mixin_kwargs["fields"])
-            existing = set(fields)
-            not_allowed = existing.symmetric_difference(allowed)
-            for field_name in not_allowed:
-                try:
-                    fields.pop(field_name)
-                except KeyError:
-                    msg = "Field `%s` is not found" % field_name
-                    raise FieldNotFound(msg) from None
+            self.check_fields_existence(allowed, existing)
+            for field_name in existing - allowed:
+                del fields[field_name]
 
         if self.dynamic_fields_mixin_kwargs["exclude"] is not None:
             # Drop all fields specified on the `exclude` kwarg.
             not_allowed = set(self.dynamic_fields_mixin_kwargs["exclude"])
+            self.check_fields_existence(not_allowed, existing)
             for field_name in not_allowed:
-                try:
-                    fields.pop(field_name)
-                except KeyError:
-                    msg = "Field `%s` is not found" % field_name
-                    raise FieldNotFound(msg) from None
+                del fields[field_name]
         return fields
 
+    @staticmethod
+    def check_fields_existence(field_names, existing_field_names):
+        missing = field_names - existing_field_names
+        if missing:
+            msg = "Field `%s` is not found" % sorted(missing)[0]
+            raise FieldNotFound(msg)
+
     @staticmethod
     def is_field_found(field_name, all_field_names, raise_exception=False):
         if field_name in all_field_names:
@@ -193,8 +233,7 @@ class DynamicFieldsMixin(RequestQueryParserMixin):
 
     @staticmethod
     def is_nested_field(field_name, field, raise_exception=False):
-        nested_classes = (Serializer, ListSerializer, DynamicSerializerMethodField)
-        if isinstance(field, nested_classes):
+        if isinstance(field, NESTED_FIELD_CLASSES):
             return True
         else:
             if raise_exception:
@@ -219,7 +258,23 @@ class DynamicFieldsMixin(RequestQueryParserMixin):
         return all_fields
 
     def select_fields(self, parsed_query, all_fields):
-        self.rename_aliased_fields(parsed_query.aliases, all_fields)
+        is_include_all_query = (
+            parsed_query.included_fields == ["*"]
+            and not parsed_query.excluded_fields
+            and not parsed_query.aliases
+        )
+        if is_include_all_query:
+            # The query is just {*} so there is nothing
+            # to validate, rename or remove
+            return all_fields, {}
+
+        # The parsed_query.aliases
+        # maps field names to their aliases
+        # The format is {field: alias ...}
+        aliases = parsed_query.aliases
+
+        if aliases:
+            self.rename_aliased_fields(aliases, all_fields)
 
         # The format is [field1, field2 ...]
         allowed_flat_fields = []
@@ -250,7 +305,7 @@ class DynamicFieldsMixin(RequestQueryParserMixin):
                 continue
             if isinstance(field, Query):
                 # Nested field
-                alias = parsed_query.aliases.get(field.field_name, field.field_name)
+                alias = aliases.get(field.field_name, field.field_name)
 
                 self.is_field_found(field.field_name, all_fields, raise_exception=True)
                 self.is_nested_field(
@@ -259,23 +314,23 @@ class DynamicFieldsMixin(RequestQueryParserMixin):
                 allowed_nested_fields.update({alias: field})
             else:
                 # Flat field
-                alias = parsed_query.aliases.get(field, field)
+                alias = aliases.get(field, field)
                 self.is_field_found(field, all_fields, raise_exception=True)
                 allowed_flat_fields.append(alias)
 
         def get_duplicates(items):
-            unique = []
+            unique = set()
             repeated = []
             for item in items:
                 if item not in unique:
-                    unique.append(item)
+                    unique.add(item)
                 else:
                     repeated.append(item)
             return repeated
 
-        included_and_excluded_fields = (
-            allowed_flat_fields + list(allowed_nested_fields.keys()) + excluded_fields
-        )
+        included_and_excluded_fields = [
+            *allowed_flat_fields, *allowed_nested_fields, *excluded_fields
+        ]
 
         including_or_excluding_field_more_than_once = len(
             included_and_excluded_fields
@@ -306,13 +361,10 @@ class DynamicFieldsMixin(RequestQueryParserMixin):
             # Here we are sure that parsed_query.excluded_fields
             # is empty which means the exclude operator(-) has not been used,
             # so parsed_query.included_fields contains only selected fields
-            all_allowed_fields = set(allowed_flat_fields) | set(
-                allowed_nested_fields.keys()
-            )
-
-            existing_fields = set(all_fields.keys())
+            all_allowed_fields = set(allowed_flat_fields)
+            all_allowed_fields.update(allowed_nested_fields)
 
-            non_selected_fields = existing_fields - all_allowed_fields
+            non_selected_fields = all_fields.keys() - all_allowed_fields
 
             for field in non_selected_fields:
                 # Remove it because we're sure it has not been selected
@@ -334,8 +386,6 @@ class DynamicFieldsMixin(RequestQueryParserMixin):
 
     @cached_property
     def dynamic_fields(self):
-        parsed_restql_query = None
-
         is_root_serializer = self.parent is None or (
             isinstance(self.parent, ListSerializer) and self.parent.parent is None
         )
@@ -349,19 +399,8 @@ class DynamicFieldsMixin(RequestQueryParserMixin):
             except QueryFormatError as e:
                 msg = "QueryFormatError: " + str(e)
                 raise ValidationError(msg, code="invalid") from None
-
-        elif isinstance(self.parent, ListSerializer):
-            field_name = self.parent.field_name
-            parent = self.parent.parent
-            if hasattr(parent, "restql_nested_parsed_queries"):
-                parent_nested_fields = parent.restql_nested_parsed_queries
-                parsed_restql_query = parent_nested_fields.get(field_name, None)
-        elif isinstance(self.parent, Serializer):
-            field_name = self.field_name
-            parent = self.parent
-            if hasattr(parent, "restql_nested_parsed_queries"):
-                parent_nested_fields = parent.restql_nested_parsed_queries
-                parsed_restql_query = parent_nested_fields.get(field_name, None)
+        else:
+            parsed_restql_query = self.get_parsed_restql_query_from_parent()
 
         if parsed_restql_query is None:
             # There's no query so we return all fields
@@ -377,20 +416,34 @@ class DynamicFieldsMixin(RequestQueryParserMixin):
         self.restql_nested_parsed_queries = nested_parsed_queries
         return selected_fields
 
+    def get_parsed_restql_query_from_parent(self):
+        # A nested serializer gets its query from the parsed queries
+        # its parent recorded while selecting its own fields
+        if isinstance(self.parent, ListSerializer):
+            field_name = self.parent.field_name
+            parent = self.parent.parent
+        else:
+            field_name = self.field_name
+            parent = self.parent
+
+        parent_nested_fields = getattr(parent, "restql_nested_parsed_queries", {})
+        return parent_nested_fields.get(field_name, None)
+
     def get_parsed_restql_query_from_query_kwarg(self):
-        parser = QueryParser()
-        return parser.parse(self.dynamic_fields_mixin_kwargs["query"])
+        return self.parse_restql_query(self.dynamic_fields_mixin_kwargs["query"])
 
     def get_parsed_restql_query(self):
-        request = self.context.get("request")
-
         if self.dynamic_fields_mixin_kwargs["query"] is not None:
             # Get from query kwarg
             return self.get_parsed_restql_query_from_query_kwarg()
         elif self.dynamic_fields_mixin_kwargs["parsed_query"] is not None:
             # Get from parsed_query kwarg
             return self.dynamic_fields_mixin_kwargs["parsed_query"]
-        elif request is not None and self.has_restql_query_param(request):
+
+        # Look up the request only when the kwargs don't provide a query,
+        # `self.context` walks up to the root serializer on every access
+        request = self.context.get("request")
+        if request is not None and self.has_restql_query_param(request):
             # Get from request query parameter
             return self.get_parsed_restql_query_from_req(request)
         return None  # There is no query so we return None as a parsed query
@@ -457,21 +510,22 @@ class EagerLoadingMixin(RequestQueryParserMixin):
         Returns the parsed query as a dict.
         """
         parsed_query = {}
-        included_fields = parsed_restql_query.included_fields
-        excluded_fields = parsed_restql_query.excluded_fields
 
-        for field in included_fields:
-            if isinstance(field, Query):
-                nested_keys = cls.get_dict_parsed_restql_query(field)
-                parsed_query[field.field_name] = nested_keys
-            else:
-                parsed_query[field] = True
-        for field in excluded_fields:
-            if isinstance(field, Query):
-                nested_keys = cls.get_dict_parsed_restql_query(field)
-                parsed_query[field.field_name] = nested_keys
-            else:
-                parsed_query[field] = False
+        # Walk the query with an explicit stack of (query, dict node)
+        # pairs instead of recursing once per nested field
+        stack = [(parsed_restql_query, parsed_query)]
+        while stack:
+            query, node = stack.pop()
+            for fields, value in (
+                (query.included_fields, True),
+                (query.excluded_fields, False),
+            ):
+                for field in fields:
+                    if isinstance(field, Query):
+                        nested_node = node[field.field_name] = {}
+                        stack.append((field, nested_node))
+                    else:
+                        node[field] = value
         return parsed_query
 
     @staticmethod
@@ -510,10 +564,15 @@ class EagerLoadingMixin(RequestQueryParserMixin):
         Applies appropriate select_related and prefetch_related calls on a
         queryset
         """
-        query = self.get_dict_parsed_restql_query(self.parsed_restql_query)
         select_mapping = self.get_select_related_mapping()
         prefetch_mapping = self.get_prefetch_related_mapping()
 
+        if not (select_mapping or prefetch_mapping):
+            # Nothing to eager load so there's no need to parse the query
+            return queryset
+
+        query = self.get_dict_parsed_restql_query(self.parsed_restql_query)
+
         to_select = self.get_related_fields(select_mapping, query)
         to_prefetch = self.get_related_fields(prefetch_mapping, query)
 
@@ -551,6 +610,27 @@ class BaseNestedMixin(object):
                 )
         return fields
 
+    @classmethod
+    @lru_cache(maxsize=None)
+    def get_model_field_rel(cls, field):
+        # Introspect related fields on the model only once per serializer
+        # class, the relation behind a field doesn't change at runtime
+        return getattr(cls.Meta.model, field).rel
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def get_many_relation_kind(cls, field):
+        # Returns the key of the `many_to` group which values
+        # of a many related nested field are classified into
+        rel = cls.get_model_field_rel(field)
+        if isinstance(rel, ManyToOneRel):
+            return "one_related"
+        elif isinstance(rel, ManyToManyRel):
+            return "many_related"
+        elif GenericRel and isinstance(rel, GenericRel):
+            return "one_generic_related"
+        return None
+
     @cached_property
     def restql_writable_nested_fields(self):
         # Make field_source -> field_value map for restql nested fields
@@ -561,6 +641,120 @@ class BaseNestedMixin(object):
                 writable_nested_fields.update({field.source: field})
         return writable_nested_fields
 
+    @staticmethod
+    def is_bulk_writable(serializer):
+        # Objects can be written in bulk only if each of them is a single
+        # row, writable nested fields and many to many fields need more
+        # than that so serializers which have them are saved one by one
+        return not any(
+            isinstance(field, (BaseSerializer, ManyRelatedField))
+            for field in serializer._writable_fields
+        )
+
+    @staticmethod
+    def get_concrete_field_names(model):
+        # Names of fields which are stored in the model's own table
+        return {field.name for field in model._meta.concrete_fields}
+
+    @staticmethod
+    def can_return_bulk_created_pks(model):
+        # Pks of objects created with `bulk_create` are needed to associate
+        # them with the parent but not all databases return them
+        features = connections[router.db_for_write(model)].features
+        if hasattr(features, "can_return_rows_from_bulk_insert"):
+            return features.can_return_rows_from_bulk_insert
+        # Django < 3.0
+        return features.can_return_ids_from_bulk_insert
+
+    def create_nested_objs(self, field, data):
+        # Get nested field serializer
+        nested_field_serializer = self.restql_writable_nested_fields[field].child
+        serializer_class = nested_field_serializer.serializer_class
+        kwargs = nested_field_serializer.validation_kwargs
+        model = nested_field_serializer.Meta.model
+        use_bulk_create = (
+            nested_field_serializer.use_bulk_create
+            # A custom `create()` must not be bypassed
+            and serializer_class.create is ModelSerializer.create
+            and self.is_bulk_writable(nested_field_serializer)
+            and self.can_return_bulk_created_pks(model)
+        )
+        objs = []
+        serializers = []
+        for values in data:
+            # Each object gets its own serializer because nested fields
+            # keep state(e.g `is_replaceable`) about the data they validate
+            serializer = serializer_class(
+                **kwargs,
+                data=values,
+                # Reject partial update by default(if partial kwarg is not passed)
+                # since we need all required fields when creating object
+                partial=nested_field_serializer.is_partial(False),
+                context={**self.context, "parent_operation": CREATE},
+            )
+            serializer.is_valid(raise_exception=True)
+            if use_bulk_create:
+                serializers.append(serializer)
+            else:
+                objs.append(serializer.save())
+
+        if serializers:
+            field_names = self.get_concrete_field_names(model)
+            if all(
+                serializer.validated_data.keys() <= field_names
+                for serializer in serializers
+            ):
+                # Insert all objects with a single query, this bypasses
+                # `create()` of the nested serializer, `Model.save()` and signals
+                objs = model.objects.bulk_create(
+                    [model(**serializer.validated_data) for serializer in serializers]
+                )
+            else:
+                # Some values are not model fields so they can't
+                # be passed to the model directly
+                objs = [serializer.save() for serializer in serializers]
+        return [obj.pk for obj in objs]
+
+    def separate_restql_nested_fields(self, validated_data):
+        """
+        Separates values of restql nested fields from the rest of
+        `validated_data` and groups them by the kind of relation.
+        """
+        # Values of non nested fields are collected into a new dict so that
+        # validated_data is not altered in case user need to access it later,
+        # these are passed on to the superclass
+        data = {}
+
+        fields = {
+            "foreignkey_related": {"replaceable": {}, "writable": {}},
+            "many_to": {
+                "many_related": {},
+                "one_related": {},
+                "one_generic_related": {},
+            },
+        }
+
+        restql_nested_fields = self.restql_writable_nested_fields
+        for field, value in validated_data.items():
+            field_serializer = restql_nested_fields.get(field)
+
+            if isinstance(field_serializer, Serializer):
+                if field_serializer.is_replaceable:
+                    fields["foreignkey_related"]["replaceable"][field] = value
+                else:
+                    fields["foreignkey_related"]["writable"][field] = value
+            elif isinstance(field_serializer, ListSerializer):
+                relation_kind = self.get_many_relation_kind(field)
+                if relation_kind is not None:
+                    fields["many_to"][relation_kind][field] = value
+                else:
+                    data[field] = value
+            else:
+                # Not a restql nested field
+                data[field] = value
+
+        return data, fields
+
 
 class NestedCreateMixin(BaseNestedMixin):
     """Create Mixin"""
@@ -592,26 +786,7 @@ class NestedCreateMixin(BaseNestedMixin):
         return objs
 
     def bulk_create_objs(self, field, data):
-        nested_fields = self.restql_writable_nested_fields
-
-        # Get nested field serializer
-        nested_field_serializer = nested_fields[field].child
-        serializer_class = nested_field_serializer.serializer_class
-        kwargs = nested_field_serializer.validation_kwargs
-        pks = []
-        for values in data:
-            serializer = serializer_class(
-                **kwargs,
-                data=values,
-                # Reject partial update by default(if partial kwarg is not passed)
-                # since we need all required fields when creating object
-                partial=nested_field_serializer.is_partial(False),
-                context={**self.context, "parent_operation": CREATE},
-            )
-            serializer.is_valid(raise_exception=True)
-            obj = serializer.save()
-            pks.append(obj.pk)
-        return pks
+        return self.create_nested_objs(field, data)
 
     def create_many_to_one_related(self, instance, data):
         # data format
@@ -620,22 +795,24 @@ class NestedCreateMixin(BaseNestedMixin):
         # CREATE: [{sub_field: value}]
         # }...}
         field_pks = {}
+        nested_fields = self.restql_writable_nested_fields
         for field, values in data.items():
-            model = self.Meta.model
-            foreignkey = getattr(model, field).field.name
-            nested_fields = self.restql_writable_nested_fields
+            foreignkey = self.get_model_field_rel(field).field.name
+            nested_model = nested_fields[field].child.Meta.model
+            pks = []
             for operation in values:
                 if operation == ADD:
-                    pks = values[operation]
-                    model = nested_fields[field].child.Meta.model
-                    qs = model.objects.filter(pk__in=pks)
+                    # Attach all existing objects with a single UPDATE
+                    qs = nested_model.objects.filter(pk__in=values[operation])
                     qs.update(**{foreignkey: instance.pk})
-                    field_pks.update({field: pks})
+                    pks.extend(values[operation])
                 elif operation == CREATE:
+                    # New objects get the foreign key on insert so
+                    # they don't need to be updated afterwards
                     for v in values[operation]:
                         v.update({foreignkey: instance.pk})
-                    pks = self.bulk_create_objs(field, values[operation])
-                    field_pks.update({field: pks})
+                    pks.extend(self.bulk_create_objs(field, values[operation]))
+            field_pks.update({field: pks})
         return field_pks
 
     def create_many_to_one_generic_related(self, instance, data):
@@ -646,7 +823,7 @@ class NestedCreateMixin(BaseNestedMixin):
             ContentType.objects.get_for_model(instance) if ContentType else None
         )
         for field, values in data.items():
-            relation = getattr(self.Meta.model, field).field
+            relation = self.get_model_field_rel(field).field
 
             nested_field_serializer = nested_fields[field].child
             serializer_class = nested_field_serializer.serializer_class
@@ -706,56 +883,17 @@ class NestedCreateMixin(BaseNestedMixin):
         return field_pks
 
     def create(self, validated_data):
-        # Make a copy of validated_data so that we don't
-        # alter it in case user need to access it later
-        validated_data_copy = {**validated_data}
+        data, fields = self.separate_restql_nested_fields(validated_data)
 
-        fields = {
-            "foreignkey_related": {"replaceable": {}, "writable": {}},
-            "many_to": {
-                "many_related": {},
-                "one_related": {},
-                "one_generic_related": {},
-            },
-        }
-
-        restql_nested_fields = self.restql_writable_nested_fields
-        for field in restql_nested_fields:
-            if field not in validated_data_copy:
-                # Nested field value is not provided
-                continue
-
-            field_serializer = restql_nested_fields[field]
-
-            if isinstance(field_serializer, Serializer):
-                if field_serializer.is_replaceable:
-                    value = validated_data_copy.pop(field)
-                    fields["foreignkey_related"]["replaceable"].update({field: value})
-                else:
-                    value = validated_data_copy.pop(field)
-                    fields["foreignkey_related"]["writable"].update({field: value})
-            elif isinstance(field_serializer, ListSerializer):
-                model = self.Meta.model
-                rel = getattr(model, field).rel
-
-                if isinstance(rel, ManyToOneRel):
-                    value = validated_data_copy.pop(field)
-                    fields["many_to"]["one_related"].update({field: value})
-                elif isinstance(rel, ManyToManyRel):
-                    value = validated_data_copy.pop(field)
-                    fields["many_to"]["many_related"].update({field: value})
-                elif GenericRel and isinstance(rel, GenericRel):
-                    value = validated_data_copy.pop(field)
-                    fields["many_to"]["one_generic_related"].update({field: value})
-
-        foreignkey_related = {
-            **fields["foreignkey_related"]["replaceable"],
-            **self.create_writable_foreignkey_related(
+        # `data` is already a new dict so foreign keys are added to it in place
+        data.update(fields["foreignkey_related"]["replaceable"])
+        data.update(
+            self.create_writable_foreignkey_related(
                 fields["foreignkey_related"]["writable"]
-            ),
-        }
+            )
+        )
 
-        instance = super().create({**validated_data_copy, **foreignkey_related})
+        instance = super().create(data)
 
         self.create_many_to_many_related(instance, fields["many_to"]["many_related"])
 
@@ -783,13 +921,14 @@ class NestedUpdateMixin(BaseNestedMixin):
         for field, nested_obj in data.items():
             setattr(instance, field, nested_obj)
         if data:
-            instance.save()
+            # Write only the replaced foreign keys
+            instance.save(update_fields=list(data))
 
     def update_writable_foreignkey_related(self, instance, data):
         # data format {field: {sub_field: value}}
         nested_fields = self.restql_writable_nested_fields
 
-        needs_save = False
+        changed_fields = []
         for field, values in data.items():
             # Get nested field serializer
             nested_field_serializer = nested_fields[field]
@@ -808,56 +947,77 @@ class NestedUpdateMixin(BaseNestedMixin):
             serializer.is_valid(raise_exception=True)
             if values is None:
                 setattr(instance, field, None)
-                needs_save = True
+                changed_fields.append(field)
             else:
                 obj = serializer.save()
                 if nested_obj is None:
                     # Patch back newly created object to instance
                     setattr(instance, field, obj)
-                    needs_save = True
-        if needs_save:
-            instance.save()
+                    changed_fields.append(field)
+        if changed_fields:
+            # Write only the foreign keys which have changed
+            instance.save(update_fields=changed_fields)
 
     def bulk_create_many_to_many_related(self, field, nested_obj, data):
-        # Get nested field serializer
-        nested_field_serializer = self.restql_writable_nested_fields[field].child
-        serializer_class = nested_field_serializer.serializer_class
-        kwargs = nested_field_serializer.validation_kwargs
-        pks = []
-        for values in data:
-            serializer = serializer_class(
-                **kwargs,
-                data=values,
-                # Reject partial update by default(if partial kwarg is not passed)
-                # since we need all required fields when creating object
-                partial=nested_field_serializer.is_partial(False),
-                context={**self.context, "parent_operation": CREATE},
-            )
-            serializer.is_valid(raise_exception=True)
-            obj = serializer.save()
-            pks.append(obj.pk)
+        pks = self.create_nested_objs(field, data)
         nested_obj.add(*pks)
         return pks
 
     def bulk_create_many_to_one_related(self, field, nested_obj, data):
-        # Get nested field serializer
+        return self.create_nested_objs(field, data)
+
+    @staticmethod
+    def get_nested_objs_by_pk(nested_obj, pks):
+        # Fetch all objects to be updated with a single query, pks which
+        # don't belong to the nested field are left out of the result.
+        # Pks might be strings(keys of a JSON object) so they're converted
+        # before being matched with pks of fetched objects
+        pk_field = nested_obj.model._meta.pk
+        objs = nested_obj.in_bulk(pks)
+        objs_by_pk = {}
+        for pk in pks:
+            obj = objs.get(pk_field.to_python(pk))
+            if obj is not None:
+                objs_by_pk[pk] = obj
+        return objs_by_pk
+
+    def save_nested_objs(self, field, serializers):
+        # Save validated nested serializers of objects being updated
         nested_field_serializer = self.restql_writable_nested_fields[field].child
-        serializer_class = nested_field_serializer.serializer_class
-        kwargs = nested_field_serializer.validation_kwargs
-        pks = []
-        for values in data:
-            serializer = serializer_class(
-                **kwargs,
-                data=values,
-                # Reject partial update by default(if partial kwarg is not passed)
-                # since we need all required fields when creating object
-                partial=nested_field_serializer.is_partial(False),
-                context={**self.context, "parent_operation": CREATE},
+        model = nested_field_serializer.Meta.model
+        use_bulk_update = (
+            nested_field_serializer.use_bulk_update
+            # A custom `update()` must not be bypassed
+            and nested_field_serializer.serializer_class.update
+            is ModelSerializer.update
+            and self.is_bulk_writable(nested_field_serializer)
+        )
+        if use_bulk_update:
+            # Pks can't be updated with `bulk_update`
+            field_names = self.get_concrete_field_names(model)
+            field_names.discard(model._meta.pk.name)
+            use_bulk_update = all(
+                serializer.validated_data.keys() <= field_names
+                for serializer in serializers
             )
-            serializer.is_valid(raise_exception=True)
-            obj = serializer.save()
-            pks.append(obj.pk)
-        return pks
+
+        if not use_bulk_update:
+            for serializer in serializers:
+                serializer.save()
+            return
+
+        # Write all objects with a single query, this bypasses
+        # `update()` of the nested serializer, `Model.save()` and signals
+        objs = []
+        update_fields = set()
+        for serializer in serializers:
+            obj = serializer.instance
+            for attr, value in serializer.validated_data.items():
+                setattr(obj, attr, value)
+                update_fields.add(attr)
+            objs.append(obj)
+        if update_fields:
+            model.objects.bulk_update(objs, update_fields)
 
     def bulk_update_many_to_many_related(self, field, nested_obj, data):
         # {pk: {sub_field: values}}
@@ -866,12 +1026,13 @@ class NestedUpdateMixin(BaseNestedMixin):
         nested_field_serializer = self.restql_writable_nested_fields[field].child
         serializer_class = nested_field_serializer.serializer_class
         kwargs = nested_field_serializer.validation_kwargs
+        objs = self.get_nested_objs_by_pk(nested_obj, list(data))
+        serializers = []
         for pk, values in data.items():
-            try:
-                obj = nested_obj.get(pk=pk)
-            except ObjectDoesNotExist:
+            if pk not in objs:
                 # This pk does't belong to nested field
                 continue
+            obj = objs[pk]
             serializer = serializer_class(
                 obj,
                 **kwargs,
@@ -882,7 +1043,8 @@ class NestedUpdateMixin(BaseNestedMixin):
                 context={**self.context, "parent_operation": UPDATE},
             )
             serializer.is_valid(raise_exception=True)
-            obj = serializer.save()
+            serializers.append(serializer)
+        self.save_nested_objs(field, serializers)
 
     def bulk_update_many_to_one_related(
         self, field, instance, data, update_foreign_key=True
@@ -893,15 +1055,15 @@ class NestedUpdateMixin(BaseNestedMixin):
         nested_field_serializer = self.restql_writable_nested_fields[field].child
         serializer_class = nested_field_serializer.serializer_class
         kwargs = nested_field_serializer.validation_kwargs
-        model = self.Meta.model
-        foreignkey = getattr(model, field).field.name
+        foreignkey = self.get_model_field_rel(field).field.name
         nested_obj = getattr(instance, field)
+        objs = self.get_nested_objs_by_pk(nested_obj, list(data))
+        serializers = []
         for pk, values in data.items():
-            try:
-                obj = nested_obj.get(pk=pk)
-            except ObjectDoesNotExist:
+            if pk not in objs:
                 # This pk does't belong to nested field
                 continue
+            obj = objs[pk]
             if update_foreign_key:
                 values.update({foreignkey: instance.pk})
             serializer = serializer_class(
@@ -914,7 +1076,8 @@ class NestedUpdateMixin(BaseNestedMixin):
                 context={**self.context, "parent_operation": UPDATE},
             )
             serializer.is_valid(raise_exception=True)
-            obj = serializer.save()
+            serializers.append(serializer)
+        self.save_nested_objs(field, serializers)
 
     def update_many_to_one_related(self, instance, data):
         # data format
@@ -924,16 +1087,15 @@ class NestedUpdateMixin(BaseNestedMixin):
         # REMOVE: [pk],
         # UPDATE: {pk: {sub_field: value}}
         # }...}
+        nested_fields = self.restql_writable_nested_fields
         for field, values in data.items():
             nested_obj = getattr(instance, field)
-            model = self.Meta.model
-            foreignkey = getattr(model, field).field.name
-            nested_fields = self.restql_writable_nested_fields
+            foreignkey = self.get_model_field_rel(field).field.name
+            nested_model = nested_fields[field].child.Meta.model
             for operation in values:
                 if operation == ADD:
                     pks = values[operation]
-                    model = nested_fields[field].child.Meta.model
-                    qs = model.objects.filter(pk__in=pks)
+                    qs = nested_model.objects.filter(pk__in=pks)
                     qs.update(**{foreignkey: instance.pk})
                 elif operation == CREATE:
                     for v in values[operation]:
@@ -942,11 +1104,10 @@ class NestedUpdateMixin(BaseNestedMixin):
                         field, nested_obj, values[operation]
                     )
                 elif operation == REMOVE:
-                    qs = nested_obj.all()
                     if values[operation] == ALL_RELATED_OBJS:
-                        qs.delete()
+                        nested_obj.all().delete()
                     else:
-                        qs.filter(pk__in=values[operation]).delete()
+                        nested_obj.filter(pk__in=values[operation]).delete()
                 elif operation == UPDATE:
                     self.bulk_update_many_to_one_related(
                         field, instance, values[operation]
@@ -969,11 +1130,10 @@ class NestedUpdateMixin(BaseNestedMixin):
                     raise ValidationError(message, code="invalid_operation")
 
                 if operation == REMOVE:
-                    qs = nested_qs.all()
                     if values[operation] == ALL_RELATED_OBJS:
-                        qs.delete()
+                        nested_qs.all().delete()
                     else:
-                        qs.filter(pk__in=values[operation]).delete()
+                        nested_qs.filter(pk__in=values[operation]).delete()
                 elif operation == UPDATE:
                     self.bulk_update_many_to_one_related(
                         field, instance, values[operation], update_foreign_key=False
@@ -1023,53 +1183,13 @@ class NestedUpdateMixin(BaseNestedMixin):
         return instance
 
     def update(self, instance, validated_data):
-        # Make a copty of validated_data so that we don't
-        # alter it in case user need to access it later
-        validated_data_copy = {**validated_data}
-
-        fields = {
-            "foreignkey_related": {"replaceable": {}, "writable": {}},
-            "many_to": {
-                "many_related": {},
-                "one_related": {},
-                "one_generic_related": {},
-            },
-        }
-
-        restql_nested_fields = self.restql_writable_nested_fields
-        for field in restql_nested_fields:
-            if field not in validated_data_copy:
-                # Nested field value is not provided
-                continue
+        data, fields = self.separate_restql_nested_fields(validated_data)
 
-            field_serializer = restql_nested_fields[field]
+        # Replaced foreign keys are passed along with other values so
+        # that they are written by the save in `super().update()`
+        data.update(fields["foreignkey_related"]["replaceable"])
 
-            if isinstance(field_serializer, Serializer):
-                if field_serializer.is_replaceable:
-                    value = validated_data_copy.pop(field)
-                    fields["foreignkey_related"]["replaceable"].update({field: value})
-                else:
-                    value = validated_data_copy.pop(field)
-                    fields["foreignkey_related"]["writable"].update({field: value})
-            elif isinstance(field_serializer, ListSerializer):
-                model = self.Meta.model
-                rel = getattr(model, field).rel
-
-                if isinstance(rel, ManyToOneRel):
-                    value = validated_data_copy.pop(field)
-                    fields["many_to"]["one_related"].update({field: value})
-                elif isinstance(rel, ManyToManyRel):
-                    value = validated_data_copy.pop(field)
-                    fields["many_to"]["many_related"].update({field: value})
-                elif GenericRel and isinstance(rel, GenericRel):
-                    value = validated_data_copy.pop(field)
-                    fields["many_to"]["one_generic_related"].update({field: value})
-
-        instance = super().update(instance, validated_data_copy)
-
-        self.update_replaceable_foreignkey_related(
-            instance, fields["foreignkey_related"]["replaceable"]
-        )
+        instance = super().update(instance, data)
 
         self.update_writable_foreignkey_related(
             instance, fields["foreignkey_related"]["writable"]
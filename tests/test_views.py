@@ -1,6 +1,8 @@
 from django.urls import reverse_lazy
 from rest_framework.test import APITestCase
 
+from django_restql.exceptions import FieldNotFound
+
 from tests.testapp.models import (
     Book,
     Instructor,
@@ -11,8 +13,17 @@ from tests.testapp.models import (
     Attachment,
 )
 from tests.testapp.serializers import (
+    BookSerializer,
+    BulkCreateCourseSerializer,
+    BulkCreateStudentSerializer,
+    BulkWriteStudentWithNotedPhonesSerializer,
+    BulkUpdateCourseSerializer,
+    BulkUpdateCourseWithNestedBooksSerializer,
+    BulkUpdateStudentSerializer,
+    BulkUpdateStudentWithPhonePksSerializer,
     WritableCourseSerializer,
     WritableStudentSerializer,
+    WritableStudentWithAliasSerializer,
 )
 
 
@@ -82,6 +93,22 @@ class DataQueryingTests(APITestCase):
             },
         )
 
+    def test_querying_data_with_unknown_field_on_fields_and_exclude_kwargs(self):
+        serializer = BookSerializer(self.book1, fields=["title", "isbn"])
+        with self.assertRaisesMessage(FieldNotFound, "Field `isbn` is not found"):
+            serializer.data
+
+        serializer = BookSerializer(self.book1, exclude=["isbn"])
+        with self.assertRaisesMessage(FieldNotFound, "Field `isbn` is not found"):
+            serializer.data
+
+    def test_changing_parsed_query_does_not_affect_later_queries(self):
+        parsed_query = BookSerializer.parse_restql_query("{title}")
+        parsed_query.included_fields.append("author")
+
+        serializer = BookSerializer(self.book1, query="{title}")
+        self.assertEqual(serializer.data, {"title": "Advanced Data Structures"})
+
     # *************** retrieve tests **************
 
     def test_retrieve_with_flat_query(self):
@@ -1459,6 +1486,148 @@ class DataMutationTests(APITestCase):
             },
         )
 
+    def test_creating_many_nested_data_with_mixed_accept_pk_values_without_request(
+        self,
+    ):
+        serializer = WritableStudentWithAliasSerializer(
+            data={
+                "name": "root",
+                "age": 30,
+                "sport_mates": {
+                    "create": [
+                        {
+                            "name": "a",
+                            "age": 2,
+                            "study_partner": {"name": "x", "age": 3},
+                        },
+                        {"name": "b", "age": 4, "study_partner": self.student.pk},
+                    ]
+                },
+            },
+        )
+
+        serializer.is_valid(raise_exception=True)
+        student = serializer.save()
+
+        self.assertEqual(
+            [
+                (mate.name, mate.study_partner.name)
+                for mate in student.sport_partners.order_by("name")
+            ],
+            [("a", "x"), ("b", "Yezy")],
+        )
+
+    def test_creating_data_with_bulk_create_kwarg_without_request(self):
+        serializer = BulkCreateStudentSerializer(
+            data={
+                "name": "Tyler",
+                "age": 25,
+                "phone_numbers": {
+                    "create": [
+                        {"number": "076711111", "type": "Office"},
+                        {"number": "073008881", "type": "Home"},
+                    ]
+                },
+            },
+            query="{name, age, phone_numbers{number, type}}",
+        )
+
+        serializer.is_valid(raise_exception=True)
+        if BulkCreateStudentSerializer.can_return_bulk_created_pks(Phone):
+            # Student INSERT, a student lookup per phone number
+            # on validation and a single INSERT for all phone numbers
+            with self.assertNumQueries(4):
+                student = serializer.save()
+        else:
+            student = serializer.save()
+
+        self.assertEqual(
+            serializer.data,
+            {
+                "name": "Tyler",
+                "age": 25,
+                "phone_numbers": [
+                    {"number": "076711111", "type": "Office"},
+                    {"number": "073008881", "type": "Home"},
+                ],
+            },
+        )
+        self.assertEqual(student.phone_numbers.count(), 2)
+
+    def test_creating_data_with_bulk_create_kwarg_and_custom_nested_create(self):
+        serializer = BulkWriteStudentWithNotedPhonesSerializer(
+            data={
+                "name": "Tyler",
+                "age": 25,
+                "phone_numbers": {
+                    "create": [
+                        {"number": "076711111", "type": "Office", "note": "Work"},
+                        {"number": "073008881", "type": "Home"},
+                    ]
+                },
+            },
+            query="{name, phone_numbers{number, type}}",
+        )
+
+        # Phone numbers are saved through the nested serializer's
+        # `create()` since it removes a value which isn't a model field
+        serializer.is_valid(raise_exception=True)
+        student = serializer.save()
+
+        self.assertEqual(
+            serializer.data,
+            {
+                "name": "Tyler",
+                "phone_numbers": [
+                    {"number": "076711111", "type": "Office"},
+                    {"number": "073008881", "type": "Home"},
+                ],
+            },
+        )
+        self.assertEqual(student.phone_numbers.count(), 2)
+
+    def test_creating_data_with_bulk_create_kwarg_on_nested_many_to_many_fields(
+        self,
+    ):
+        serializer = BulkCreateCourseSerializer(
+            data={
+                "name": "Algorithms",
+                "code": "CS120",
+                "books": {
+                    "create": [
+                        {
+                            "title": "Algorithms Intro",
+                            "author": "T.Cormen",
+                            "genres": {
+                                "create": [
+                                    {"title": "Science", "description": "Sci"}
+                                ]
+                            },
+                        },
+                        {"title": "Graph Theory", "author": "F.Harary"},
+                    ]
+                },
+            },
+            query="{name, code, books{title, genres{title}}}",
+        )
+
+        # Books have a writable nested field(genres) so
+        # they're saved one by one instead of in bulk
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        self.assertEqual(
+            serializer.data,
+            {
+                "name": "Algorithms",
+                "code": "CS120",
+                "books": [
+                    {"title": "Algorithms Intro", "genres": [{"title": "Science"}]},
+                    {"title": "Graph Theory", "genres": []},
+                ],
+            },
+        )
+
     def test_updating_data_without_request(self):
         serializer = WritableStudentSerializer(
             self.student,
@@ -1499,6 +1668,168 @@ class DataMutationTests(APITestCase):
             },
         )
 
+    def test_updating_data_with_bulk_update_kwarg_without_request(self):
+        serializer = BulkUpdateStudentSerializer(
+            self.student,
+            data={
+                "phone_numbers": {
+                    "update": {
+                        self.phone1.pk: {"number": "076711111"},
+                        self.phone2.pk: {"type": "Office"},
+                    }
+                },
+            },
+            query="{name, phone_numbers{number, type}}",
+            partial=True,
+        )
+
+        serializer.is_valid(raise_exception=True)
+        # Student UPDATE, phone numbers SELECT, a student lookup per
+        # phone number on validation and a single UPDATE for all of them
+        with self.assertNumQueries(5):
+            serializer.save()
+
+        self.assertEqual(
+            serializer.data,
+            {
+                "name": "Yezy",
+                "phone_numbers": [
+                    {"number": "076711111", "type": "Office"},
+                    {"number": "073008880", "type": "Office"},
+                ],
+            },
+        )
+
+    def test_updating_data_with_bulk_update_kwarg_and_custom_nested_update(self):
+        serializer = BulkWriteStudentWithNotedPhonesSerializer(
+            self.student,
+            data={
+                "phone_numbers": {
+                    "update": {
+                        self.phone1.pk: {"number": "076711111", "note": "Work"},
+                    }
+                },
+            },
+            query="{name, phone_numbers{number, type}}",
+            partial=True,
+        )
+
+        # Phone numbers are saved through the nested serializer's
+        # `update()` since it removes a value which isn't a model field
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        self.assertEqual(
+            serializer.data,
+            {
+                "name": "Yezy",
+                "phone_numbers": [
+                    {"number": "076711111", "type": "Office"},
+                    {"number": "073008880", "type": "Home"},
+                ],
+            },
+        )
+
+    def test_updating_data_with_bulk_update_kwarg_and_writable_nested_pk(self):
+        serializer = BulkUpdateStudentWithPhonePksSerializer(
+            self.student,
+            data={
+                "phone_numbers": {
+                    "update": {
+                        self.phone1.pk: {"id": self.phone1.pk, "number": "076711111"},
+                    }
+                },
+            },
+            query="{name, phone_numbers{number, type}}",
+            partial=True,
+        )
+
+        # Pks can't be written with `bulk_update` so
+        # phone numbers are saved one by one
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        self.assertEqual(
+            serializer.data,
+            {
+                "name": "Yezy",
+                "phone_numbers": [
+                    {"number": "076711111", "type": "Office"},
+                    {"number": "073008880", "type": "Home"},
+                ],
+            },
+        )
+
+    def test_updating_data_with_bulk_update_kwarg_on_many_to_many_field(self):
+        serializer = BulkUpdateCourseSerializer(
+            self.course1,
+            data={
+                "books": {
+                    "update": {
+                        self.book1.pk: {"title": "Data Structures"},
+                        self.book2.pk: {"author": "J.Davis"},
+                    }
+                },
+            },
+            query="{name, books{title, author}}",
+            partial=True,
+        )
+
+        serializer.is_valid(raise_exception=True)
+        # Course UPDATE, books SELECT and a single UPDATE for all books
+        with self.assertNumQueries(3):
+            serializer.save()
+
+        self.assertEqual(
+            serializer.data,
+            {
+                "name": "Data Structures",
+                "books": [
+                    {"title": "Data Structures", "author": "S.Mobit"},
+                    {"title": "Basic Data Structures", "author": "J.Davis"},
+                ],
+            },
+        )
+
+    def test_updating_data_with_bulk_update_kwarg_on_nested_many_to_many_fields(
+        self,
+    ):
+        serializer = BulkUpdateCourseWithNestedBooksSerializer(
+            self.course1,
+            data={
+                "books": {
+                    "update": {
+                        self.book1.pk: {
+                            "title": "Data Structures",
+                            "genres": {
+                                "create": [
+                                    {"title": "Science", "description": "Sci"}
+                                ]
+                            },
+                        },
+                    }
+                },
+            },
+            query="{name, books{title, genres{title}}}",
+            partial=True,
+        )
+
+        # Books have a writable nested field(genres) so
+        # they're saved one by one instead of in bulk
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        self.assertEqual(
+            serializer.data,
+            {
+                "name": "Data Structures",
+                "books": [
+                    {"title": "Data Structures", "genres": [{"title": "Science"}]},
+                    {"title": "Basic Data Structures", "genres": []},
+                ],
+            },
+        )
+
     # **************** POST Tests ********************* #
 
     def test_post_on_pk_nested_foreignkey_related_field(self):
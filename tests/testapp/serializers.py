@@ -40,6 +40,30 @@ class PhoneSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
         fields = ["number", "type", "student"]
 
 
+class PhoneWithNoteSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    note = serializers.CharField(write_only=True, required=False)
+
+    class Meta:
+        model = Phone
+        fields = ["number", "type", "student", "note"]
+
+    def create(self, validated_data):
+        validated_data.pop("note", None)
+        return super().create(validated_data)
+
+    def update(self, instance, validated_data):
+        validated_data.pop("note", None)
+        return super().update(instance, validated_data)
+
+
+class PhoneWithWritablePkSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    id = serializers.IntegerField(required=False)
+
+    class Meta:
+        model = Phone
+        fields = ["id", "number", "type", "student"]
+
+
 ################# Serializers for Data Querying Testing ################
 class CourseSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     books = BookSerializer(many=True, read_only=True)
@@ -149,6 +173,36 @@ class WritableCourseSerializer(DynamicFieldsMixin, NestedModelSerializer):
         fields = ["name", "code", "books", "instructor"]
 
 
+class BulkCreateCourseSerializer(DynamicFieldsMixin, NestedModelSerializer):
+    books = NestedField(
+        WritableBookSerializer, many=True, required=False, bulk_create=True
+    )
+
+    class Meta:
+        model = Course
+        fields = ["name", "code", "books"]
+
+
+class BulkUpdateCourseSerializer(DynamicFieldsMixin, NestedModelSerializer):
+    books = NestedField(BookSerializer, many=True, required=False, bulk_update=True)
+
+    class Meta:
+        model = Course
+        fields = ["name", "code", "books"]
+
+
+class BulkUpdateCourseWithNestedBooksSerializer(
+    DynamicFieldsMixin, NestedModelSerializer
+):
+    books = NestedField(
+        WritableBookSerializer, many=True, required=False, bulk_update=True
+    )
+
+    class Meta:
+        model = Course
+        fields = ["name", "code", "books"]
+
+
 class ReplaceableStudentSerializer(DynamicFieldsMixin, NestedModelSerializer):
     course = NestedField(
         WritableCourseSerializer, accept_pk=True, allow_null=True, required=False
@@ -189,6 +243,54 @@ class WritableStudentSerializer(DynamicFieldsMixin, NestedModelSerializer):
         fields = ["name", "age", "course", "phone_numbers"]
 
 
+class BulkCreateStudentSerializer(DynamicFieldsMixin, NestedModelSerializer):
+    phone_numbers = NestedField(
+        PhoneSerializer, many=True, required=False, bulk_create=True
+    )
+
+    class Meta:
+        model = Student
+        fields = ["name", "age", "phone_numbers"]
+
+
+class BulkUpdateStudentSerializer(DynamicFieldsMixin, NestedModelSerializer):
+    phone_numbers = NestedField(
+        PhoneSerializer, many=True, required=False, bulk_update=True
+    )
+
+    class Meta:
+        model = Student
+        fields = ["name", "age", "phone_numbers"]
+
+
+class BulkWriteStudentWithNotedPhonesSerializer(
+    DynamicFieldsMixin, NestedModelSerializer
+):
+    phone_numbers = NestedField(
+        PhoneWithNoteSerializer,
+        many=True,
+        required=False,
+        bulk_create=True,
+        bulk_update=True,
+    )
+
+    class Meta:
+        model = Student
+        fields = ["name", "age", "phone_numbers"]
+
+
+class BulkUpdateStudentWithPhonePksSerializer(
+    DynamicFieldsMixin, NestedModelSerializer
+):
+    phone_numbers = NestedField(
+        PhoneWithWritablePkSerializer, many=True, required=False, bulk_update=True
+    )
+
+    class Meta:
+        model = Student
+        fields = ["name", "age", "phone_numbers"]
+
+
 class WritableStudentWithAliasSerializer(DynamicFieldsMixin, NestedModelSerializer):
     program = NestedField(
         WritableCourseSerializer, source="course", allow_null=True, required=False